@@ -3,6 +3,7 @@
 import argparse
 import logging
 import sys
+from functools import cache
 from pathlib import Path
 
 import semver
@@ -17,6 +18,32 @@ USAGE = f"./{Path(__file__).name} [options]"
 DESCRIPTION = """Ensure snap channels and LP recipes for the specified branch."""
 
 
+# The Launchpad objects below are the same for every recipe, only fetch them once.
+@cache
+def _lp_project():
+    return lp.client().projects[util.SNAP_NAME]
+
+
+@cache
+def _lp_owner():
+    return lp.client().people[lp.OWNER]
+
+
+@cache
+def _lp_repo():
+    return lp.client().git_repositories.getDefaultRepository(target=_lp_project())
+
+
+@cache
+def _lp_archive():
+    return lp.client().archives.getByReference(reference="ubuntu")
+
+
+@cache
+def _lp_snappy_series():
+    return lp.client().snappy_serieses.getByName(name="16")
+
+
 def ensure_snap_channels(
     flavour: str, ver: semver.Version, tip: bool, dry_run: bool
 ) -> list[str]:
@@ -90,12 +117,11 @@ def ensure_lp_recipe(
         ",".join(channels),
     )
     client = lp.client()
-    lp_project = client.projects[util.SNAP_NAME]
-    lp_owner = client.people[lp.OWNER]
-    lp_repo = client.git_repositories.getDefaultRepository(target=lp_project)
-    lp_ref = lp_repo.getRefByPath(path=flavor_branch)
-    lp_archive = client.archives.getByReference(reference="ubuntu")
-    lp_snappy_series = client.snappy_serieses.getByName(name="16")
+    lp_project = _lp_project()
+    lp_owner = _lp_owner()
+    lp_ref = _lp_repo().getRefByPath(path=flavor_branch)
+    lp_archive = _lp_archive()
+    lp_snappy_series = _lp_snappy_series()
     manifest = dict(
         auto_build=True,
         auto_build_archive=lp_archive,
@@ -154,7 +180,9 @@ def ensure_lp_recipe(
     return recipe_name
 
 
-def prepare_track_builds(branch: str, args: argparse.Namespace):
+def prepare_track_builds(
+    branch: str, ver: semver.Version, flavors: list[str], args: argparse.Namespace
+):
     """Prepares all flavour branches to be built.
 
     * Ensure snap channels are available in the snapstore.
@@ -162,23 +190,17 @@ def prepare_track_builds(branch: str, args: argparse.Namespace):
     * Ensure LP recipes are building from correct branches.
     * Ensure LP recipes are pushing to the correct snap channels.
     """
-    with repo.clone(util.SNAP_REPO, branch) as dir:
-        version_file = dir / "build-scripts/components/kubernetes/version"
-        branch_ver = version_file.read_text().strip()
-        ver = semver.Version.parse(branch_ver.strip("v"))
-        flavors = util.flavors(dir)
-
-        LOG.info("Current version detected %s", branch_ver)
-        tip = branch == "main"
-        for flavour in flavors:
-            if ver.prerelease and flavour != "classic":
-                LOG.info(
-                    f"Ignoring pre-release flavour: {flavour}, only 'classic' "
-                    "pre-releases are supported."
-                )
-                continue
-            channels = ensure_snap_channels(flavour, ver, tip, args.dry_run)
-            ensure_lp_recipe(flavour, ver, channels, tip, args.dry_run)
+    LOG.info("Current version detected v%s on %s", ver, branch)
+    tip = branch == "main"
+    for flavour in flavors:
+        if ver.prerelease and flavour != "classic":
+            LOG.info(
+                f"Ignoring pre-release flavour: {flavour}, only 'classic' "
+                "pre-releases are supported."
+            )
+            continue
+        channels = ensure_snap_channels(flavour, ver, tip, args.dry_run)
+        ensure_lp_recipe(flavour, ver, channels, tip, args.dry_run)
 
 
 def main():
@@ -189,24 +211,30 @@ def main():
         "--branches", nargs="*", type=str, help="Specific branches to confirm"
     )
     args = util.setup_arguments(arg_parser)
-    branches = args.branches
 
-    if not branches:
+    if not args.branches:
+        # Branches listed from the remote are known to exist and are
+        # filtered once, only user-provided branches need validating.
         all_branches = repo.ls_branches(util.SNAP_REPO)
-        branches = [b for b in all_branches if util.TIP_BRANCH.match(b)]
+        branches = [b for b in all_branches if util.TIP_BRANCH.fullmatch(b)]
         LOG.info("No branches specified, checking '%s'", ", ".join(branches))
-    for branch in branches:
-        if not repo.is_branch(util.SNAP_REPO, branch):
-            LOG.error("Branch %s does not exist", branch)
-            continue
-        if not util.TIP_BRANCH.match(branch):
-            LOG.warning(
-                "Skipping branch '%s' - not a supported branch r/%s/",
-                branch,
-                util.TIP_BRANCH.pattern,
-            )
-            continue
-        prepare_track_builds(branch, args)
+    else:
+        branches = []
+        for branch in args.branches:
+            if not repo.is_branch(util.SNAP_REPO, branch):
+                LOG.error("Branch %s does not exist", branch)
+                continue
+            if not util.TIP_BRANCH.fullmatch(branch):
+                LOG.warning(
+                    "Skipping branch '%s' - not a supported branch r/%s/",
+                    branch,
+                    util.TIP_BRANCH.pattern,
+                )
+                continue
+            branches.append(branch)
+
+    for branch, ver, flavors in util.inspect_branches(branches):
+        prepare_track_builds(branch, ver, flavors, args)
 
 
 is_main = __name__ == "__main__"
@@ -4,33 +4,43 @@ import argparse
 import json
 import logging
 import re
+from functools import cache
 from typing import List, Optional
 
-import requests
+import util.http as http
 import util.util as util
-from packaging.version import Version
+from packaging.version import InvalidVersion, Version
 
 K8S_TAGS_URL = "https://api.github.com/repos/kubernetes/kubernetes/tags"
 
+PRERELEASE_RE = re.compile(r"v\d+\.\d+\.\d-(?:alpha|beta|rc)\.\d+")
+PRERELEASE_SUFFIX_RE = re.compile(r"(-[a-zA-Z]+)\.[0-9]+")
+
 LOG = logging.getLogger(__name__)
 
 
 def _url_get(url: str) -> str:
-    r = requests.get(url, timeout=5)
+    r = http.session().get(url, timeout=5)
     r.raise_for_status()
     return r.text
 
 
-def get_k8s_tags() -> List[str]:
+@cache
+def get_k8s_tags() -> tuple[str, ...]:
     """Retrieve semantically ordered k8s releases, newest to oldest."""
     response = _url_get(K8S_TAGS_URL)
     tags_json = json.loads(response)
-    if len(tags_json) == 0:
+    versions = []
+    for tag in tags_json:
+        try:
+            versions.append((Version(tag["name"]), tag["name"]))
+        except InvalidVersion:
+            LOG.warning("Ignoring k8s tag with invalid version: %s", tag["name"])
+    if not versions:
         raise ValueError("No k8s tags retrieved.")
-    tag_names = [tag["name"] for tag in tags_json]
     # Github already sorts the tags semantically but let's not rely on that.
-    tag_names.sort(key=lambda x: Version(x), reverse=True)
-    return tag_names
+    versions.sort(reverse=True)
+    return tuple(name for _, name in versions)
 
 
 # k8s release naming:
@@ -85,19 +95,19 @@ def _branch_exists(
         cmd += ["-r"]
 
     stdout, stderr = util.execute(cmd, cwd=project_basedir)
-    return branch_name in stdout
+    # Each listed branch is prefixed by a two character marker, e.g. "* ".
+    return branch_name in {line[2:] for line in stdout.splitlines()}
 
 
 def get_prerelease_git_branch(prerelease: str):
     """Retrieve the name of the k8s-snap git branch for a given k8s pre-release."""
-    prerelease_re = r"v\d+\.\d+\.\d-(?:alpha|beta|rc)\.\d+"
-    if not re.match(prerelease_re, prerelease):
+    if not PRERELEASE_RE.match(prerelease):
         raise ValueError("Unexpected k8s pre-release name: %s", prerelease)
 
     # Use a single branch for all pre-releases of a given risk level,
     # e.g. v1.33.0-alpha.0 -> autoupdate/v1.33.0-alpha
     branch = f"autoupdate/{prerelease}"
-    return re.sub(r"(-[a-zA-Z]+)\.[0-9]+", r"\1", branch)
+    return PRERELEASE_SUFFIX_RE.sub(r"\1", branch)
 
 
 def remove_obsolete_prereleases():
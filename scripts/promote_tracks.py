@@ -40,6 +40,7 @@ IGNORE_TRACKS = ["latest"]
 # The snap risk levels, used to find the next risk level for a revision.
 RISK_LEVELS = ["edge", "beta", "candidate", "stable"]
 NEXT_RISK = RISK_LEVELS[1:] + [None]
+RISK_INDEX = {risk: idx for idx, risk in enumerate(RISK_LEVELS)}
 
 # Revisions stay at a certain risk level for some days before being promoted.
 DAYS_TO_STAY_IN_EDGE = 1
@@ -78,7 +79,7 @@ class Channel(Hyphenized):
 
     @cached_property
     def next_risk(self):
-        return NEXT_RISK[RISK_LEVELS.index(self.risk)]
+        return NEXT_RISK[RISK_INDEX[self.risk]]
 
     def __getattr__(self, name):
         return getattr(self.channel, name)
@@ -121,9 +122,7 @@ def _build_upgrade_channels(
 
     # First highest risk on this track (excluding next-risk)
     same_track_channels = [
-        f"{track}/{r}"
-        for idx, r in enumerate(RISK_LEVELS)
-        if idx > RISK_LEVELS.index(next_risk)
+        f"{track}/{r}" for r in RISK_LEVELS[RISK_INDEX[next_risk] + 1 :]
     ]
     for source in reversed(same_track_channels):
         if source in channels:
@@ -159,8 +158,8 @@ def _create_channel_map():
     channel_map: dict[str, dict[str, Channel]] = defaultdict(dict)
 
     for c in snap_info["channel-map"]:
-        channel_data = ChannelMetadata.bake(**c.pop("channel"))
-        revision_data = Channel.bake(channel=channel_data, **c)
+        channel_data = ChannelMetadata.bake(**c["channel"])
+        revision_data = Channel.bake(**{**c, "channel": channel_data})
         channel_map[channel_data.architecture][channel_data.name] = revision_data
 
     return channel_map
@@ -169,59 +168,78 @@ def _create_channel_map():
 def create_proposal(args):
     channel_map = _create_channel_map()
     proposals = []
+    ignored_arches = set(getattr(args, "ignore_arches", []))
+    # Shared by every architecture, so resolve it once per proposal pass.
+    latest_upstream_stable = k8s_release.get_latest_stable()
 
     for arch, channels in channel_map.items():
-        proposals.extend(_create_arch_proposals(arch, channels, args))
+        if arch in ignored_arches:
+            LOG.debug("Skipping ignored architecture %s", arch)
+            continue
+        proposals.extend(
+            _create_arch_proposals(arch, channels, latest_upstream_stable, args)
+        )
 
     if args.gh_action:
         core.set_output("proposals", json.dumps(proposals))
     return proposals
 
 
-def _create_arch_proposals(arch, channels: dict[str, Channel], args):
+def _create_arch_proposals(
+    arch, channels: dict[str, Channel], latest_upstream_stable: str, args
+):
     proposals = []
     ignored_tracks = IGNORE_TRACKS + getattr(args, "ignore_tracks", [])
-    ignored_arches = getattr(args, "ignore_arches", [])
-    days_to_stay_in_risk = {
+    days_in_risk = {
         "edge": args.days_in_edge_risk,
         "beta": args.days_in_beta_risk,
         "candidate": args.days_in_candidate_risk,
     }
+    # Evaluate every channel against the same point in time: a revision has
+    # completed purgatory if it was released at or before its risk's cutoff.
+    now = datetime.datetime.now(datetime.timezone.utc)
+    purgatory_cutoff = {
+        risk: now - datetime.timedelta(days=days) for risk, days in days_in_risk.items()
+    }
 
     def sorter(info: Channel):
-        return (info.name, RISK_LEVELS.index(info.risk))
+        return (info.name, RISK_INDEX[info.risk])
+
+    # Ignored tracks are matched once per track rather than once per channel.
+    track_ignored: dict[str, bool] = {}
+
+    def is_ignored(track: str) -> bool:
+        if track not in track_ignored:
+            matched_pattern = next(
+                (p for p in ignored_tracks if re.fullmatch(p, track)), None
+            )
+            if matched_pattern:
+                LOG.debug(
+                    "Skipping ignored track '%s' (matched pattern: '%s')",
+                    track,
+                    matched_pattern,
+                )
+            track_ignored[track] = bool(matched_pattern)
+        return track_ignored[track]
 
-    latest_upstream_stable = k8s_release.get_latest_stable()
     for channel_info in sorted(channels.values(), key=sorter, reverse=True):
         track = channel_info.channel.track
         risk = channel_info.risk
         next_risk = channel_info.next_risk
         revision = channel_info.revision
-        chan_log = logging.getLogger(f"{logger_name} {track:>15}/{risk:<9}")
 
         if not track:
-            chan_log.debug("Skipping trackless channel")
+            LOG.debug("Skipping trackless channel %s", channel_info.name)
             continue
 
         if not next_risk:
-            chan_log.debug("Skipping promoting stable")
-            continue
-
-        matched_pattern = next(
-            (pattern for pattern in ignored_tracks if re.fullmatch(pattern, track)),
-            None,
-        )
-        if matched_pattern:
-            chan_log.debug(
-                f"Skipping ignored track '{track}' (matched pattern: '{matched_pattern}')"
-            )
+            LOG.debug("Skipping promoting stable %s", channel_info.name)
             continue
 
-        if arch in ignored_arches:
-            chan_log.debug("Skipping ignored architecture")
+        if is_ignored(track):
             continue
 
-        now = datetime.datetime.now(datetime.timezone.utc)
+        chan_log = logging.getLogger(f"{logger_name} {track:>15}/{risk:<9}")
 
         if released_at := channel_info.channel.released_at:
             released_at_date = datetime.datetime.fromisoformat(released_at)
@@ -235,16 +253,14 @@ def _create_arch_proposals(arch, channels: dict[str, Channel], args):
             released_at_date,
         )
 
+        next_channel = channels.get(f"{track}/{next_risk}", EMPTY_CHANNEL)
         purgatory_complete = (
             released_at_date
-            and (now - released_at_date).days >= days_to_stay_in_risk[risk]
-            and channels.get(f"{track}/{risk}", EMPTY_CHANNEL).revision
-            != channels.get(f"{track}/{next_risk}", EMPTY_CHANNEL).revision
+            and released_at_date <= purgatory_cutoff[risk]
+            and channel_info.revision != next_channel.revision
         )
         new_patch_in_edge = (
-            risk == "edge"
-            and channels.get(f"{track}/{next_risk}", EMPTY_CHANNEL).version
-            != channels.get(f"{track}/{risk}", EMPTY_CHANNEL).version
+            risk == "edge" and next_channel.version != channel_info.version
         )
         revision_in_stable = bool(
             channels.get(f"{track}/stable", EMPTY_CHANNEL).revision
@@ -322,7 +338,8 @@ def release_revision(args):
 
 
 def execute_proposal_test(args):
-    branches = {args.branch, "main"}  # branch choices
+    # Prefer the tests on the proposal's branch, falling back to main
+    branches = dict.fromkeys([args.branch, "main"])
     cmd = f"{TOX_PATH} -e integration -- -k test_version_upgrades"
 
     for branch in branches:
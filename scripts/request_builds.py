@@ -6,7 +6,6 @@ import sys
 from pathlib import Path
 from typing import Generator, Iterable
 
-import semver
 import util.lp as lp
 import util.repo as repo
 import util.util as util
@@ -26,43 +25,38 @@ def rebuild_branches(branches: Iterable[str], args: argparse.Namespace):
     """
     client = lp.client()
     owner = client.people[lp.OWNER]
+    for branch, ver, flavors in util.inspect_branches(branches):
+        LOG.info("Kubernetes version detected v%s on %s", ver, branch)
+        tip = branch == "main"
+
+        for flavor in flavors:
+            recipe_name = util.recipe_name(flavor, ver, tip)
+            LOG.info("  Searching for recipe %s", recipe_name)
+            if recipe := client.snaps.getByName(owner=owner, name=recipe_name):
+                archive = recipe.auto_build_archive
+                channels = recipe.auto_build_channels
+                pocket = recipe.auto_build_pocket
+
+                dry_msg = " (dry-run)" if args.dry_run else ""
+                LOG.info("  Requesting build for %s%s", recipe_name, dry_msg)
+                (not args.dry_run) and recipe.requestBuilds(
+                    archive=archive, channels=channels, pocket=pocket
+                )
+
+
+def tip_branches(
+    branches: Iterable[str], remote_branches: Iterable[str]
+) -> Generator[str, None, None]:
+    existing = set(remote_branches)
     for branch in branches:
-        LOG.info("Cloning tip branch %s", branch)
-        with repo.clone(util.SNAP_REPO, branch) as dir:
-            version_file = dir / "build-scripts/components/kubernetes/version"
-            branch_ver = version_file.read_text().strip()
-            ver = semver.Version.parse(branch_ver.strip("v"))
-            flavors = util.flavors(dir)
-
-            LOG.info("  Kubernetes version detected %s", branch_ver)
-            tip = branch == "main"
-
-            flavors = util.flavors(dir)
-            for flavor in flavors:
-                recipe_name = util.recipe_name(flavor, ver, tip)
-                LOG.info("  Searching for recipe %s", recipe_name)
-                if recipe := client.snaps.getByName(owner=owner, name=recipe_name):
-                    archive = recipe.auto_build_archive
-                    channels = recipe.auto_build_channels
-                    pocket = recipe.auto_build_pocket
-
-                    dry_msg = " (dry-run)" if args.dry_run else ""
-                    LOG.info("  Requesting build for %s%s", recipe_name, dry_msg)
-                    (not args.dry_run) and recipe.requestBuilds(
-                        archive=archive, channels=channels, pocket=pocket
-                    )
-
-
-def tip_branches(branches: Iterable[str]) -> Generator[str, None, None]:
-    for branch in branches:
-        if not util.TIP_BRANCH.match(branch):
+        if not util.TIP_BRANCH.fullmatch(branch):
             LOG.warning(
                 "Skipping branch '%s' - not a tip branch r/%s/",
                 branch,
                 util.TIP_BRANCH.pattern,
             )
             continue
-        if not repo.is_branch(util.SNAP_REPO, branch):
+        if branch not in existing:
             LOG.error("Branch %s does not exist", branch)
             continue
         yield branch
@@ -77,11 +71,12 @@ def main():
     )
     args = util.setup_arguments(arg_parser)
     branches = args.branches
+    remote_branches = list(repo.ls_branches(util.SNAP_REPO))
 
     if not branches:
-        branches = repo.ls_branches(util.SNAP_REPO)
+        branches = remote_branches
         LOG.info("No branches specified, checking all branches")
-    rebuild_branches(tip_branches(branches), args)
+    rebuild_branches(tip_branches(branches, remote_branches), args)
 
 
 is_main = __name__ == "__main__"
@@ -0,0 +1,25 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Retry idempotent requests on transient API failures, leaving the final
+# error response for the caller's raise_for_status().
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    raise_on_status=False,
+)
+
+_local = threading.local()
+
+
+def session() -> requests.Session:
+    """Return a pooled session, one per thread as sessions aren't thread-safe."""
+    if not (s := getattr(_local, "session", None)):
+        s = _local.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=RETRY)
+        s.mount("https://", adapter)
+    return s
@@ -45,8 +45,20 @@ def snap_by_owner(snap: str):
     )
 
 
+@cache
+def _branches_by_track(snap) -> dict[str, str]:
+    """Map each track of a snap to the branch of the first recipe publishing it."""
+    branches: dict[str, str] = {}
+    for recipe in snap_by_owner(snap):
+        # Recipes built from a repository URL have no git ref to map.
+        if not (link := recipe.git_ref_link) or "+ref/" not in link:
+            continue
+        branch = link.split("+ref/")[1]
+        for chan in recipe.store_channels:
+            branches.setdefault(chan.split("/")[0], branch)
+    return branches
+
+
 def branch_from_track(snap, track):
     """Return the branch name for a given track."""
-    for recipe in snap_by_owner(snap):
-        if any(chan.split("/")[0] == track for chan in recipe.store_channels):
-            return recipe.git_ref_link.split("+ref/")[1]
+    return _branches_by_track(snap).get(track)
@@ -2,8 +2,9 @@ import base64
 import json
 import logging
 import os
+from functools import cache
 
-import requests
+import util.http as http
 
 LOG = logging.getLogger(__name__)
 INFO_URL = "https://api.snapcraft.io/v2/snaps/info/"
@@ -17,8 +18,13 @@ HEADERS = {
 TIMEOUT = 10
 
 
+@cache
 def info(snap_name):
-    r = requests.get(INFO_URL + snap_name, headers=HEADERS, timeout=TIMEOUT)
+    """Return the store info of a snap, cached until a track is created.
+
+    The returned dict is shared between callers and must not be modified.
+    """
+    r = http.session().get(INFO_URL + snap_name, headers=HEADERS, timeout=TIMEOUT)
     r.raise_for_status()
     return json.loads(r.text)
 
@@ -56,14 +62,17 @@ def create_track(snap_name: str, track_name: str) -> None:
         "Content-Type": "application/json",
     }
     data = [{"name": track_name}]
-    r = requests.post(url, headers=headers, json=data, timeout=TIMEOUT)
+    r = http.session().post(url, headers=headers, json=data, timeout=TIMEOUT)
     r.raise_for_status()
+    info.cache_clear()
 
 
+@cache
 def get_charmhub_auth_macaroon() -> str:
     """Get the charmhub macaroon from the environment.
 
     This is used to authenticate with the charmhub API.
+    The decoded macaroon is cached for the lifetime of the process.
     Will raise a ValueError if CHARMCRAFT_AUTH is not set or the credentials are malformed.
     """
     # Auth credentials provided by "charmcraft login --export $outfile"
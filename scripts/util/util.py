@@ -2,8 +2,9 @@ import argparse
 import logging
 import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List
 
 import semver
 import util.repo as repo
@@ -11,17 +12,54 @@ import util.repo as repo
 LOG = logging.getLogger(__name__)
 SNAP_NAME: str = "k8s"
 SNAP_REPO: str = "https://github.com/canonical/k8s-snap.git/"
+# Match whole branch names with TIP_BRANCH.fullmatch().
 TIP_BRANCH = re.compile(
-    r"^(?:main)|^(?:release-\d+\.\d+)$|^(?:autoupdate\/v\d+\.\d+\.\d+-(?:alpha|beta|rc))$"
+    r"main|release-\d+\.\d+|autoupdate/v\d+\.\d+\.\d+-(?:alpha|beta|rc)"
 )
 EXEC_TIMEOUT = 60
+# Number of k8s-snap branches to clone concurrently.
+CLONE_WORKERS = 4
 
 
 def flavors(dir: str) -> list[str]:
     patch_dir = Path("build-scripts/patches")
     output = repo.ls_tree(dir, patch_dir)
-    patches = set(Path(f).relative_to(patch_dir).parents[0] for f in output)
-    return sorted([p.name for p in patches] + ["classic"])
+    # Each flavor is a directory of patches directly under the patch dir.
+    prefix = f"{patch_dir}/"
+    patches = set()
+    for f in output:
+        flavor, sep, _ = f.removeprefix(prefix).partition("/")
+        if sep:
+            patches.add(flavor)
+    return sorted(patches | {"classic"})
+
+
+def inspect_branch(branch: str) -> tuple[semver.Version, list[str]]:
+    """Clone a k8s-snap branch and return its kubernetes version and flavors."""
+    with repo.clone(SNAP_REPO, branch) as dir:
+        version_file = dir / "build-scripts/components/kubernetes/version"
+        branch_ver = version_file.read_text().strip()
+        return semver.Version.parse(branch_ver.strip("v")), flavors(dir)
+
+
+def inspect_branches(
+    branches: Iterable[str],
+) -> Iterator[tuple[str, semver.Version, list[str]]]:
+    """Inspect k8s-snap branches, cloning up to CLONE_WORKERS at a time.
+
+    Only the clones run concurrently, the results are yielded in order on the
+    calling thread. Keep the Launchpad requests made while consuming them serial
+    as the launchpadlib client isn't thread-safe.
+    """
+    branches = list(branches)
+    pool = ThreadPoolExecutor(max_workers=CLONE_WORKERS)
+    try:
+        details = pool.map(inspect_branch, branches)
+        for branch, (ver, flavors) in zip(branches, details):
+            yield branch, ver, flavors
+    finally:
+        # Don't clone the remaining branches if the caller stops early.
+        pool.shutdown(wait=True, cancel_futures=True)
 
 
 def recipe_name(flavor: str, ver: semver.Version, tip: bool) -> str:
@@ -0,0 +1,50 @@
+import json
+import unittest.mock as mock
+
+import k8s_release
+import pytest
+
+MOCK_TAGS = ["v1.32.1", "v1.33.0-rc.0", "v1.32.0", "not-a-version", "v1.33.0-alpha.1"]
+
+
+@pytest.fixture(autouse=True)
+def url_get():
+    k8s_release.get_k8s_tags.cache_clear()
+    with mock.patch("k8s_release._url_get") as mocked:
+        mocked.return_value = json.dumps([{"name": tag} for tag in MOCK_TAGS])
+        yield mocked
+
+
+def test_get_k8s_tags_sorted():
+    tags = k8s_release.get_k8s_tags()
+    assert tags == ("v1.33.0-rc.0", "v1.33.0-alpha.1", "v1.32.1", "v1.32.0")
+
+
+@pytest.mark.parametrize("tags", [[], ["not-a-version"]])
+def test_get_k8s_tags_none_valid(url_get, tags):
+    url_get.return_value = json.dumps([{"name": tag} for tag in tags])
+    with pytest.raises(ValueError, match="No k8s tags retrieved"):
+        k8s_release.get_k8s_tags()
+
+
+def test_get_k8s_tags_cached(url_get):
+    assert k8s_release.get_latest_stable() == "v1.32.1"
+    assert k8s_release.get_outstanding_prerelease() == "v1.33.0-rc.0"
+    assert k8s_release.get_obsolete_prereleases() == ["v1.33.0-alpha.1"]
+    url_get.assert_called_once_with(k8s_release.K8S_TAGS_URL)
+
+
+@pytest.mark.parametrize(
+    "prerelease, branch",
+    [
+        ("v1.33.0-alpha.0", "autoupdate/v1.33.0-alpha"),
+        ("v1.33.0-rc.2", "autoupdate/v1.33.0-rc"),
+    ],
+)
+def test_get_prerelease_git_branch(prerelease, branch):
+    assert k8s_release.get_prerelease_git_branch(prerelease) == branch
+
+
+def test_get_prerelease_git_branch_invalid():
+    with pytest.raises(ValueError):
+        k8s_release.get_prerelease_git_branch("v1.33.0")
@@ -157,6 +157,21 @@ def test_ignored_tracks(track, ignored_patterns, expected_ignored):
     )
 
 
+@pytest.mark.parametrize(
+    "ignored_arches, expected_ignored",
+    [(["amd64"], True), (["arm64"], False), ([], False)],
+)
+def test_ignored_arches(ignored_arches, expected_ignored):
+    ignore_args = argparse.Namespace(**{**vars(args), "ignore_arches": ignored_arches})
+    with (
+        freeze_time("2000-01-02"),
+        _make_channel_map(MOCK_TRACK, "edge", extra_risk="stable"),
+        _mock_k8s_versions(),
+    ):
+        proposals = promote_tracks.create_proposal(ignore_args)
+    assert (len(proposals) == 0) == expected_ignored
+
+
 def test_new_stable():
     # In this scenario, the channel version matches the latest stable.
     with _make_channel_map(MOCK_TRACK, "edge"), _mock_k8s_versions("v1.31.0"):
@@ -0,0 +1,18 @@
+import threading
+
+import util.http as http
+
+
+def test_session_reused_per_thread():
+    assert http.session() is http.session(), "Expected the same session"
+
+    sessions = []
+    thread = threading.Thread(target=lambda: sessions.append(http.session()))
+    thread.start()
+    thread.join()
+    assert sessions[0] is not http.session(), "Expected a session per thread"
+
+
+def test_session_retries():
+    adapter = http.session().get_adapter("https://api.github.com")
+    assert adapter.max_retries is http.RETRY, "Expected retries on https"
@@ -51,3 +51,29 @@ def test_create_client_no_creds():
     with pytest.raises(ValueError, match="No launchpad credentials found"):
         lp.client()
     assert lp.client.cache_info().misses == 2, "Expected a cache miss"
+
+
+@mock.patch("util.lp.snap_by_owner")
+def test_branch_from_track(mock_snap_by_owner):
+    lp._branches_by_track.cache_clear()
+    mock_snap_by_owner.return_value = [
+        mock.Mock(git_ref_link=None, store_channels=["1.30-classic/edge"]),
+        mock.Mock(
+            git_ref_link="https://github.com/canonical/k8s-snap.git",
+            store_channels=["1.31-classic/edge"],
+        ),
+        mock.Mock(
+            git_ref_link="https://lp/~containers/k8s/+git/k8s-snap/+ref/release-1.32",
+            store_channels=["1.32-classic/edge", "1.32-classic/beta"],
+        ),
+        mock.Mock(
+            git_ref_link="https://lp/~containers/k8s/+git/k8s-snap/+ref/main",
+            store_channels=["latest/edge", "1.32-classic/edge"],
+        ),
+    ]
+    assert lp.branch_from_track("k8s", "1.32-classic") == "release-1.32"
+    assert lp.branch_from_track("k8s", "latest") == "main"
+    assert lp.branch_from_track("k8s", "1.31") is None
+    assert lp.branch_from_track("k8s", "1.30-classic") is None
+    assert lp.branch_from_track("k8s", "1.31-classic") is None
+    mock_snap_by_owner.assert_called_once_with("k8s")
@@ -7,9 +7,15 @@ import requests
 import util.snapstore as snapstore
 
 
-@patch("util.snapstore.requests.get")
+@pytest.fixture(autouse=True)
+def clear_caches():
+    snapstore.info.cache_clear()
+    snapstore.get_charmhub_auth_macaroon.cache_clear()
+
+
+@patch("requests.Session.get")
 def test_info_success(mock_get):
-    # Mock the response from requests.get
+    # Mock the response from the session's get
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.text = json.dumps({"name": "test-snap"})
@@ -24,7 +30,15 @@ def test_info_success(mock_get):
     )
 
 
-@patch("util.snapstore.requests.get")
+@patch("requests.Session.get")
+def test_info_cached(mock_get):
+    mock_get.return_value.text = json.dumps({"name": "test-snap"})
+
+    assert snapstore.info("test-snap") is snapstore.info("test-snap")
+    mock_get.assert_called_once()
+
+
+@patch("requests.Session.get")
 def test_info_http_error(mock_get):
     # Mock an HTTPError
     mock_response = MagicMock()
@@ -35,7 +49,7 @@ def test_info_http_error(mock_get):
         snapstore.info("non-existent-snap")
 
 
-@patch("util.snapstore.requests.get")
+@patch("requests.Session.get")
 def test_info_url_error(mock_get):
     # Mock a ConnectionError (similar to URLError in urllib)
     mock_get.side_effect = requests.ConnectionError("Failed to connect")
@@ -60,15 +74,17 @@ def test_ensure_track_create(mock_create_track, mock_track_exists):
     mock_create_track.assert_called_once_with("test-snap", "test-track")
 
 
-@patch("util.snapstore.requests.post")
+@patch("requests.Session.post")
 @patch("util.snapstore.get_charmhub_auth_macaroon", return_value="mock-macaroon")
 def test_create_track(mock_get_auth, mock_post):
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_post.return_value = mock_response
 
-    snapstore.create_track("test-snap", "test-track")
+    with patch.object(snapstore.info, "cache_clear") as mock_cache_clear:
+        snapstore.create_track("test-snap", "test-track")
 
+    mock_cache_clear.assert_called_once_with()
     mock_get_auth.assert_called_once()
     mock_post.assert_called_once_with(
         "https://api.charmhub.io/v1/snap/test-snap/tracks",
@@ -88,6 +104,7 @@ def test_create_track(mock_get_auth, mock_post):
 def test_get_charmhub_auth_macaroon(mock_getenv):
     result = snapstore.get_charmhub_auth_macaroon()
     assert result == "mock-macaroon"
+    assert snapstore.get_charmhub_auth_macaroon() == "mock-macaroon"
     mock_getenv.assert_called_once_with("CHARMCRAFT_AUTH")
 
 
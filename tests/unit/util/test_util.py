@@ -1,6 +1,9 @@
 import argparse
+import contextlib
+import time
 import unittest.mock as mock
 
+import pytest
 import semver
 import util.util as util
 
@@ -16,6 +19,80 @@ def test_flavors(mock_ls_tree):
     assert result == expected
 
 
+@mock.patch("util.repo.ls_tree")
+def test_flavors_ignores_loose_files_and_nesting(mock_ls_tree):
+    mock_ls_tree.return_value = [
+        "build-scripts/patches/README",
+        "build-scripts/patches/flavor1/patch1",
+        "build-scripts/patches/flavor1/nested/patch2",
+    ]
+    expected = ["classic", "flavor1"]
+    result = util.flavors("some_dir")
+    assert result == expected
+
+
+@mock.patch("util.util.flavors", return_value=["classic", "strict"])
+@mock.patch("util.repo.clone")
+def test_inspect_branch(mock_clone, mock_flavors, tmp_path):
+    version_file = tmp_path / "build-scripts/components/kubernetes/version"
+    version_file.parent.mkdir(parents=True)
+    version_file.write_text("v1.33.0-rc.0\n")
+    mock_clone.return_value = contextlib.nullcontext(tmp_path)
+
+    ver, flavors = util.inspect_branch("autoupdate/v1.33.0-rc")
+    mock_clone.assert_called_once_with(util.SNAP_REPO, "autoupdate/v1.33.0-rc")
+    mock_flavors.assert_called_once_with(tmp_path)
+    assert ver == semver.Version.parse("1.33.0-rc.0")
+    assert flavors == ["classic", "strict"]
+
+
+@mock.patch("util.util.inspect_branch")
+def test_inspect_branches(mock_inspect_branch):
+    versions = {
+        "main": semver.Version.parse("1.34.0"),
+        "release-1.33": semver.Version.parse("1.33.2"),
+    }
+    mock_inspect_branch.side_effect = lambda b: (versions[b], ["classic"])
+
+    result = list(util.inspect_branches(["release-1.33", "main"]))
+    assert result == [
+        ("release-1.33", versions["release-1.33"], ["classic"]),
+        ("main", versions["main"], ["classic"]),
+    ]
+
+
+@mock.patch("util.util.inspect_branch")
+def test_inspect_branches_stops_early(mock_inspect_branch):
+    branches = [f"release-1.{minor}" for minor in range(20, 32)]
+
+    def inspect(branch):
+        if branch != branches[0]:
+            # Keep the other clones busy so the rest stay queued.
+            time.sleep(0.2)
+        return semver.Version.parse("1.0.0"), ["classic"]
+
+    mock_inspect_branch.side_effect = inspect
+    with pytest.raises(RuntimeError):
+        for _ in util.inspect_branches(branches):
+            raise RuntimeError("Launchpad error")
+    assert mock_inspect_branch.call_count < len(branches)
+
+
+@pytest.mark.parametrize(
+    "branch, is_tip",
+    [
+        ("main", True),
+        ("release-1.33", True),
+        ("autoupdate/v1.34.0-alpha", True),
+        ("maintenance", False),
+        ("release-1.33-fix", False),
+        ("autoupdate/v1.34.0-alpha.1", False),
+    ],
+)
+def test_tip_branch(branch, is_tip):
+    assert bool(util.TIP_BRANCH.fullmatch(branch)) is is_tip
+
+
 def test_recipe_name_tip():
     ver = semver.Version.parse("1.2.3")
     flavor = "flavor1"